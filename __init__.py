@@ -14,6 +14,9 @@ bl_info = {
     "category": "3D View",
 }
 
+def update_pet_scale(self, context):
+    renderer.refresh_scale(context)
+
 class BlendPetPreferences(bpy.types.AddonPreferences):
     bl_idname = __package__
     
@@ -22,7 +25,8 @@ class BlendPetPreferences(bpy.types.AddonPreferences):
         default=4.0,
         min=1.0,
         max=10.0,
-        description="How big the cat is"
+        description="How big the cat is",
+        update=update_pet_scale
     )
 
     def draw(self, context):
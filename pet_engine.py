@@ -1,5 +1,7 @@
 import random
 import time
+from bisect import bisect
+from itertools import accumulate
 from typing import Optional, Dict, List, Tuple
 
 # -- Constants --
@@ -42,14 +44,51 @@ STATE_FPS: Dict[str, int] = {
     'SLEEP': 2,
 }
 
-NON_LOOPING_STATES = {'LOOK_BEHIND', 'PLAY', 'POUNCE', 'IDLE2'}
+NON_LOOPING_STATES = frozenset({'LOOK_BEHIND', 'PLAY', 'POUNCE', 'IDLE2'})
+
+# Per-state seconds per frame, precomputed so the tick never divides
+FRAME_TIMES: Dict[str, float] = {
+    state: 1.0 / STATE_FPS.get(state, DEFAULT_FPS) for state in ANIM_ROWS
+}
+
+# Horizontal speed (pixels per 60Hz frame) for states that move the pet
+MOVE_SPEEDS: Dict[str, float] = {
+    'WALK': 1.5,
+    'RUN': 4.0,
+}
+
+# Weighted transition tables: (choices, cumulative weights)
+IDLE2_TRANSITIONS: Tuple[Tuple[str, ...], Tuple[float, ...]] = (
+    ('IDLE', 'WALK'),
+    tuple(accumulate((0.5, 0.5))),
+)
+
+DEFAULT_TRANSITIONS: Tuple[Tuple[str, ...], Tuple[float, ...]] = (
+    ('IDLE', 'IDLE2', 'SLEEP', 'LICK', 'WALK', 'RUN', 'LOOK_BEHIND', 'CLEAN', 'PLAY', 'POUNCE'),
+    tuple(accumulate((0.35, 0.05, 0.1, 0.1, 0.25, 0.05, 0.02, 0.05, 0.02, 0.01))),
+)
 
 def log(msg: str, is_error: bool = False):
     prefix = "BlendPet Error" if is_error else "BlendPet"
     print(f"{prefix}: {msg}")
 
+def weighted_choice(transitions: Tuple[Tuple[str, ...], Tuple[float, ...]]) -> str:
+    """Pick from a transition table without building temporary lists."""
+    choices, cum_weights = transitions
+    hi = len(cum_weights) - 1
+    return choices[bisect(cum_weights, random.random() * cum_weights[hi], 0, hi)]
+
 class PetEngine:
-    """Handles pet logic, state transitions, and animation timing."""
+    """Handles pet logic, state transitions, and animation timing.
+
+    State lives in fixed slots so the steady-state tick only rebinds
+    existing attributes and never grows the instance.
+    """
+    __slots__ = (
+        'sprite_path', 'x', 'y', 'state', 'row', 'frame_index', 'facing_right',
+        'timer', 'last_tick', 'state_timer', 'state_duration', 'target_x', 'speed',
+    )
+
     def __init__(self, sprite_path: str):
         self.sprite_path = sprite_path
         self.x: float = 100.0
@@ -90,8 +129,8 @@ class PetEngine:
             self.state_duration = random.uniform(5.0, 10.0)
         
         # Initialize state-specific logic
-        if self.state in ['WALK', 'RUN']:
-            self.target_x = random.uniform(100, 1000) 
+        if self.state in MOVE_SPEEDS:
+            self.target_x = random.uniform(100.0, 1000.0) 
             self.facing_right = self.target_x > self.x
             
     def update(self, screen_width: Optional[float] = None):
@@ -104,11 +143,8 @@ class PetEngine:
         self.state_timer += dt
         
         # -- Animation Loop --
-        target_fps = STATE_FPS.get(self.state, DEFAULT_FPS)
-        frame_time = 1.0 / target_fps
-        
         limit = FRAME_COUNTS.get(self.state, DEFAULT_FRAME_COUNT)
-        if self.timer >= frame_time:
+        if self.timer >= FRAME_TIMES[self.state]:
             if self.state in NON_LOOPING_STATES:
                  if self.frame_index >= limit - 1:
                      self.set_state('IDLE')
@@ -119,9 +155,10 @@ class PetEngine:
             
         # -- Movement --
         moved = False
-        if self.state == 'WALK':
+        speed = MOVE_SPEEDS.get(self.state)
+        if speed is not None:
             dx = self.target_x - self.x
-            step = 1.5 * (dt * 60.0) 
+            step = speed * (dt * 60.0)
             
             if abs(dx) < step:
                 self.x = self.target_x
@@ -129,17 +166,6 @@ class PetEngine:
             else:
                 self.x += step if dx > 0 else -step
                 moved = True
-                
-        elif self.state == 'RUN':
-             dx = self.target_x - self.x
-             step = 4.0 * (dt * 60.0)
-             
-             if abs(dx) < step:
-                 self.x = self.target_x
-                 self.set_state('IDLE')
-             else:
-                 self.x += step if dx > 0 else -step
-                 moved = True
         
         # -- Wall Collision --
         if screen_width and moved:
@@ -165,16 +191,10 @@ class PetEngine:
             return
             
         if self.state == 'IDLE2':
-            choices = ['IDLE', 'WALK']
-            weights = [0.5,    0.5]
-            self.set_state(random.choices(choices, weights=weights, k=1)[0])
+            self.set_state(weighted_choice(IDLE2_TRANSITIONS))
             return
 
-        choices = ['IDLE', 'IDLE2', 'SLEEP', 'LICK', 'WALK', 'RUN', 'LOOK_BEHIND', 'CLEAN', 'PLAY', 'POUNCE']
-        weights = [0.35,   0.05,    0.1,     0.1,    0.25,   0.05,  0.02,           0.05,    0.02,   0.01]
-        
-        next_state = random.choices(choices, weights=weights, k=1)[0]
-        self.set_state(next_state)
+        self.set_state(weighted_choice(DEFAULT_TRANSITIONS))
 
 # -- Singleton Instance --
 engine: Optional[PetEngine] = None
@@ -190,11 +210,13 @@ def update(screen_width: Optional[float] = None):
     if engine:
         engine.update(screen_width)
 
-def get_render_data() -> Optional[Tuple[float, float, int, int, bool]]:
-    """Get state data for rendering."""
-    if engine:
-        return (engine.x, engine.y, engine.row, engine.frame_index, engine.facing_right)
-    return None
+def get_render_data() -> Optional[PetEngine]:
+    """Get state data for rendering.
+
+    Returns the engine itself rather than a snapshot tuple; read
+    ``x``, ``y``, ``row``, ``frame_index`` and ``facing_right`` from it.
+    """
+    return engine
 
 def set_state(name: str):
     """Manually force a state on the engine."""
@@ -13,10 +13,27 @@ UPSCALE_FACTOR = 8
 IMAGE_NAME = "BlendPetSprite"
 UPSCALED_IMAGE_NAME = "BlendPetSprite_Upscaled"
 
+try:
+    from . import pet_engine
+except ImportError:
+    # If running as relative package fails (e.g. standalone test)
+    import pet_engine
+
+# Unit quad, placed and sized per draw through the matrix stack
+QUAD_VERTICES = ((0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0))
+QUAD_INDICES = ((0, 1, 2), (2, 3, 0))
+
 _handles: List[Tuple[Any, Any]] = []
 texture: Optional[gpu.types.GPUTexture] = None
 cached_shader: Optional[gpu.types.GPUShader] = None
 
+# One batch per (row, frame, facing) sprite cell, built on first use
+_batches: List[Optional[gpu.types.GPUBatch]] = [None] * (SPRITE_ROWS * SPRITE_COLUMNS * 2)
+
+# Reused translate/scale buffers so drawing doesn't build new sequences
+_offset: List[float] = [0.0, 0.0]
+_size: List[float] = [SPRITE_SIZE * 4, SPRITE_SIZE * 4]
+
 def log(msg: str, is_error: bool = False):
     prefix = "BlendPet Error" if is_error else "BlendPet"
     print(f"{prefix}: {msg}")
@@ -81,44 +98,11 @@ def load_texture() -> Optional[gpu.types.GPUTexture]:
             return None
     return None
 
-def draw_callback():
-    global texture
-    
-    if not texture:
-        texture = load_texture()
-        
-    try:
-        from . import pet_engine
-        state = pet_engine.get_render_data()
-    except ImportError:
-        # If running as relative package fails (e.g. standalone test)
-        import pet_engine
-        state = pet_engine.get_render_data()
-        
-    if not state:
-        return
-        
-    x, y, row, frame_index, facing_right = state 
-
-    context = bpy.context
-    region_width = context.region.width
-    
-    # Visual Configuration
-    try:
-        prefs = context.preferences.addons[__package__].preferences
-        scale = prefs.pet_scale
-    except:
-        scale = 4.0 
-    
-    # Snap these to integers to avoid sub-pixel blurring
-    w = int(SPRITE_SIZE * scale)
-    h = int(SPRITE_SIZE * scale)
-    
-    # Position
-    draw_x = int(x % region_width)
-    draw_y = 0 
-
-    if texture:
+def get_batch(shader: gpu.types.GPUShader, row: int, frame_index: int, facing_right: bool) -> gpu.types.GPUBatch:
+    """Return the cached quad batch for a sprite cell, building it once."""
+    slot = (row * SPRITE_COLUMNS + frame_index) * 2 + facing_right
+    batch = _batches[slot]
+    if batch is None:
         # UV Calculations
         uv_y_top = 1.0 - (row * SPRITE_SIZE) / (SPRITE_SIZE * SPRITE_ROWS)
         uv_y_bot = 1.0 - ((row + 1) * SPRITE_SIZE) / (SPRITE_SIZE * SPRITE_ROWS)
@@ -128,15 +112,6 @@ def draw_callback():
         
         if not facing_right:
             uv_x_left, uv_x_right = uv_x_right, uv_x_left
-            
-        vertices = (
-            (draw_x, draw_y),
-            (draw_x + w, draw_y),
-            (draw_x + w, draw_y + h),
-            (draw_x, draw_y + h),
-        )
-        
-        indices = ((0, 1, 2), (2, 3, 0))
         
         texture_coords = (
             (uv_x_left, uv_y_bot),
@@ -145,18 +120,67 @@ def draw_callback():
             (uv_x_left, uv_y_top),
         )
         
-        shader_img = gpu.shader.from_builtin('IMAGE')
-        batch_img = batch_for_shader(shader_img, 'TRIS', {"pos": vertices, "texCoord": texture_coords}, indices=indices)
+        batch = batch_for_shader(shader, 'TRIS', {"pos": QUAD_VERTICES, "texCoord": texture_coords}, indices=QUAD_INDICES)
+        _batches[slot] = batch
+    return batch
+
+def clear_batches():
+    """Drop cached batches so they are rebuilt against a fresh shader."""
+    for i in range(len(_batches)):
+        _batches[i] = None
+
+def refresh_scale(context: Any = None):
+    """Cache the pet scale preference so drawing doesn't look it up."""
+    context = context or bpy.context
+    try:
+        prefs = context.preferences.addons[__package__].preferences
+        scale = prefs.pet_scale
+    except:
+        scale = 4.0
+    
+    # Snap to integers to avoid sub-pixel blurring
+    _size[0] = int(SPRITE_SIZE * scale)
+    _size[1] = int(SPRITE_SIZE * scale)
+
+def draw_callback():
+    global texture, cached_shader
+    
+    if not texture:
+        texture = load_texture()
+        
+    pet = pet_engine.get_render_data()
+    if pet is None:
+        return
+
+    region_width = bpy.context.region.width
+    
+    if texture:
+        if cached_shader is None:
+            cached_shader = gpu.shader.from_builtin('IMAGE')
+        shader_img = cached_shader
+        batch_img = get_batch(shader_img, pet.row, pet.frame_index, pet.facing_right)
+        
+        # Position, snapped to whole pixels to avoid sub-pixel blurring.
+        # Stay in float: int() would allocate a new int once x > 256.
+        draw_x = pet.x % region_width
+        _offset[0] = draw_x - draw_x % 1.0
         
         gpu.state.blend_set('ALPHA')
-        shader_img.bind()
+        gpu.matrix.push()
         try:
-             shader_img.uniform_sampler("image", texture)
-        except:
-            pass
-            
-        batch_img.draw(shader_img)
-        gpu.state.blend_set('NONE')
+            gpu.matrix.translate(_offset)
+            gpu.matrix.scale(_size)
+            shader_img.bind()
+            try:
+                 shader_img.uniform_sampler("image", texture)
+            except:
+                pass
+                
+            batch_img.draw(shader_img)
+        finally:
+            # Always restore the shared matrix stack and blend state
+            gpu.matrix.pop()
+            gpu.state.blend_set('NONE')
     else:
         # Fallback text only if texture completely fails
         pass
@@ -167,6 +191,7 @@ def register_draw_handler():
         return
     
     print("BlendPet: Registering draw handler...")
+    refresh_scale()
     
     # Target Dope Sheet / Timeline / Graph
     space_types = [bpy.types.SpaceDopeSheetEditor, bpy.types.SpaceGraphEditor]
@@ -180,7 +205,7 @@ def register_draw_handler():
             print(f"BlendPet: Failed to register {st}: {e}")
 
 def unregister_draw_handler():
-    global _handles
+    global _handles, cached_shader
     print(f"BlendPet: Unregistering {len(_handles)} handlers...")
     
     for st, h in _handles:
@@ -191,6 +216,8 @@ def unregister_draw_handler():
             print(f"BlendPet: Failed to remove handler from {st}: {e}")
             
     _handles.clear()
+    clear_batches()
+    cached_shader = None
     
     # Force clear screen (Redraw one last time to remove the drawing)
     print("BlendPet: Forcing redraw...")
@@ -2,6 +2,10 @@ import unittest
 import time
 import os
 import sys
+import dis
+import gc
+import random
+import tracemalloc
 
 # Add the project root to sys.path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -63,5 +67,127 @@ class TestPetEngine(unittest.TestCase):
         self.assertGreater(self.engine.x, 40)
         self.assertTrue(self.engine.facing_right)
 
+    def test_render_data(self):
+        data = pet_engine.get_render_data()
+        self.assertIs(data, self.engine)
+        self.assertEqual(data.row, pet_engine.ANIM_ROWS['IDLE'])
+
+    def test_weighted_choice_matches_random_choices(self):
+        # Same picks as the original random.choices calls for the same seed
+        cases = (
+            (pet_engine.IDLE2_TRANSITIONS, [0.5, 0.5]),
+            (pet_engine.DEFAULT_TRANSITIONS, [0.35, 0.05, 0.1, 0.1, 0.25, 0.05, 0.02, 0.05, 0.02, 0.01]),
+        )
+        for transitions, weights in cases:
+            choices = list(transitions[0])
+            random.seed(1234)
+            expected = [random.choices(choices, weights=weights, k=1)[0] for _ in range(10000)]
+            random.seed(1234)
+            actual = [pet_engine.weighted_choice(transitions) for _ in range(10000)]
+            self.assertEqual(actual, expected)
+
+
+# Opcodes that create a new container or function object when executed
+ALLOCATING_OPCODES = {
+    'BUILD_TUPLE', 'BUILD_LIST', 'BUILD_SET', 'BUILD_MAP', 'BUILD_CONST_KEY_MAP',
+    'BUILD_SLICE', 'LIST_EXTEND', 'SET_UPDATE', 'DICT_UPDATE', 'MAKE_FUNCTION',
+}
+
+
+def prime_freelists():
+    """Fill the float freelist so steady-state floats never reach the allocator."""
+    floats = [i + 0.5 for i in range(1000)]
+    del floats
+
+
+def allocating_ops(func):
+    """Return (line, opcode) for every container-building instruction in func."""
+    return [
+        (inst.positions.lineno, inst.opname)
+        for inst in dis.get_instructions(func)
+        if inst.opname in ALLOCATING_OPCODES
+    ]
+
+
+class TestSteadyStateAllocations(unittest.TestCase):
+    """Long simulated runs must not allocate per tick.
+
+    Short-lived floats and small tuples are recycled through CPython's
+    freelists and never reach tracemalloc or the gc counters, so a tuple
+    built and dropped every tick is invisible at runtime.
+    test_hot_path_builds_no_containers covers those by counting the
+    container-building instructions in the tick's code instead.
+    """
+    TICKS = 50000
+    DT = 0.1
+
+    def setUp(self):
+        pet_engine.initialize("fake_path.png")
+        self.engine = pet_engine.engine
+        # Warm up so every state, transition and collision path has run once
+        self.run_ticks(self.TICKS // 10)
+        prime_freelists()
+
+    def run_ticks(self, count):
+        engine = self.engine
+        for _ in range(count):
+            # Rewind the last tick instead of sleeping to simulate a fixed dt
+            engine.last_tick -= self.DT
+            pet_engine.update(1000.0)
+
+    def test_no_per_tick_allocations(self):
+        engine = self.engine
+        worst = 0
+        tracemalloc.start()
+        try:
+            for _ in range(self.TICKS):
+                engine.last_tick -= self.DT
+                before = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+                pet_engine.update(1000.0)
+                peak = tracemalloc.get_traced_memory()[1] - before
+                if peak > worst:
+                    worst = peak
+        finally:
+            tracemalloc.stop()
+
+        self.assertEqual(worst, 0)
+
+    def test_hot_path_builds_no_containers(self):
+        hot_path = (
+            pet_engine.update,
+            pet_engine.get_render_data,
+            pet_engine.weighted_choice,
+            pet_engine.PetEngine.update,
+            pet_engine.PetEngine.set_state,
+            pet_engine.PetEngine.pick_new_state,
+        )
+        for func in hot_path:
+            with self.subTest(func=func.__qualname__):
+                self.assertEqual(allocating_ops(func), [])
+
+    def gc_growth(self, count, collections):
+        def on_gc(phase, info):
+            if phase == 'start':
+                collections.append(info['generation'])
+
+        gc.collect()
+        before = gc.get_count()[0]
+        gc.callbacks.append(on_gc)
+        try:
+            self.run_ticks(count)
+        finally:
+            gc.callbacks.remove(on_gc)
+        return gc.get_count()[0] - before
+
+    def test_no_gc_pressure(self):
+        collections = []
+        # Reading gc.get_count() itself tracks one tuple; subtract that exactly
+        overhead = self.gc_growth(0, collections)
+        growth = self.gc_growth(self.TICKS, collections)
+
+        self.assertEqual(collections, [])
+        self.assertEqual(growth - overhead, 0)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,301 @@
+import unittest
+import contextlib
+import gc
+import importlib
+import io
+import os
+import sys
+import tracemalloc
+import types
+from unittest import mock
+
+# Add the project root to sys.path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pet_engine
+from test_pet_engine import allocating_ops, prime_freelists
+
+# Stand-ins for Blender's modules, recording just enough to assert on
+gpu_state = types.SimpleNamespace(blend='NONE', depth=0, offset=None, scale=None)
+built_batches = []
+built_shaders = []
+
+
+class StubShader:
+    def bind(self):
+        pass
+
+    def uniform_sampler(self, name, value):
+        pass
+
+
+class StubBatch:
+    def __init__(self, shader, kind, content, indices=None):
+        self.shader = shader
+        self.content = content
+        self.indices = indices
+        self.fail = False
+
+    def draw(self, shader):
+        if self.fail:
+            raise RuntimeError("draw failed")
+
+
+class StubSpace:
+    @staticmethod
+    def draw_handler_add(callback, args, region_type, draw_type):
+        return object()
+
+    @staticmethod
+    def draw_handler_remove(handle, region_type):
+        pass
+
+
+def batch_for_shader(shader, kind, content, indices=None):
+    batch = StubBatch(shader, kind, content, indices)
+    built_batches.append(batch)
+    return batch
+
+
+def from_builtin(name):
+    shader = StubShader()
+    built_shaders.append(shader)
+    return shader
+
+
+def blend_set(mode):
+    gpu_state.blend = mode
+
+
+def push():
+    gpu_state.depth += 1
+
+
+def pop():
+    gpu_state.depth -= 1
+
+
+def translate(offset):
+    gpu_state.offset = offset
+
+
+def scale(size):
+    gpu_state.scale = size
+
+
+def make_stub_modules():
+    bpy = types.ModuleType('bpy')
+    bpy.context = types.SimpleNamespace(
+        region=types.SimpleNamespace(width=800),
+        preferences=types.SimpleNamespace(addons={}),
+        window_manager=types.SimpleNamespace(windows=[]),
+    )
+    bpy.types = types.SimpleNamespace(SpaceDopeSheetEditor=StubSpace, SpaceGraphEditor=StubSpace)
+    bpy.data = types.SimpleNamespace(images={})
+
+    gpu = types.ModuleType('gpu')
+    gpu.types = types.SimpleNamespace(GPUTexture=object, GPUShader=StubShader, GPUBatch=StubBatch)
+    gpu.shader = types.SimpleNamespace(from_builtin=from_builtin)
+    gpu.state = types.SimpleNamespace(blend_set=blend_set)
+    gpu.matrix = types.SimpleNamespace(push=push, pop=pop, translate=translate, scale=scale)
+
+    gpu_extras = types.ModuleType('gpu_extras')
+    gpu_extras_batch = types.ModuleType('gpu_extras.batch')
+    gpu_extras_batch.batch_for_shader = batch_for_shader
+    gpu_extras.batch = gpu_extras_batch
+
+    return {
+        'bpy': bpy,
+        'gpu': gpu,
+        'gpu_extras': gpu_extras,
+        'gpu_extras.batch': gpu_extras_batch,
+        'blf': types.ModuleType('blf'),
+    }
+
+
+renderer = None
+_modules_patch = None
+
+
+def setUpModule():
+    global renderer, _modules_patch
+    _modules_patch = mock.patch.dict(sys.modules, make_stub_modules())
+    _modules_patch.start()
+    sys.modules.pop('renderer', None)
+    renderer = importlib.import_module('renderer')
+
+
+def tearDownModule():
+    _modules_patch.stop()
+
+
+class RendererTestCase(unittest.TestCase):
+    def setUp(self):
+        pet_engine.initialize("fake_path.png")
+        self.engine = pet_engine.engine
+
+        renderer.clear_batches()
+        renderer.cached_shader = None
+        # Any truthy texture skips loading the sprite sheet through bpy.data
+        renderer.texture = object()
+        renderer.refresh_scale()
+
+        built_batches.clear()
+        built_shaders.clear()
+        gpu_state.blend = 'NONE'
+        gpu_state.depth = 0
+        gpu_state.offset = None
+        gpu_state.scale = None
+
+
+class TestRenderer(RendererTestCase):
+    def test_batch_built_once_per_cell(self):
+        shader = StubShader()
+        batches = []
+        for row in range(renderer.SPRITE_ROWS):
+            for frame_index in range(renderer.SPRITE_COLUMNS):
+                for facing_right in (True, False):
+                    batch = renderer.get_batch(shader, row, frame_index, facing_right)
+                    self.assertIs(renderer.get_batch(shader, row, frame_index, facing_right), batch)
+                    batches.append(batch)
+
+        self.assertEqual(len(built_batches), renderer.SPRITE_ROWS * renderer.SPRITE_COLUMNS * 2)
+        self.assertEqual(len(set(map(id, batches))), len(batches))
+
+    def test_draw_reuses_batch(self):
+        renderer.draw_callback()
+        renderer.draw_callback()
+        self.assertEqual(len(built_batches), 1)
+        self.assertEqual(len(built_shaders), 1)
+
+    def test_left_facing_swaps_u(self):
+        shader = StubShader()
+        right = renderer.get_batch(shader, 2, 3, True).content["texCoord"]
+        left = renderer.get_batch(shader, 2, 3, False).content["texCoord"]
+
+        self.assertEqual(right, ((3 / 8, 0.7), (4 / 8, 0.7), (4 / 8, 0.8), (3 / 8, 0.8)))
+        self.assertEqual(left, ((4 / 8, 0.7), (3 / 8, 0.7), (3 / 8, 0.8), (4 / 8, 0.8)))
+
+    def test_draw_places_unit_quad(self):
+        self.engine.x = 1234.7
+        renderer.draw_callback()
+
+        batch = built_batches[0]
+        self.assertEqual(batch.content["pos"], renderer.QUAD_VERTICES)
+        self.assertEqual(gpu_state.offset, [434.0, 0.0])
+        self.assertEqual(gpu_state.scale, [128, 128])
+        self.assertEqual(gpu_state.depth, 0)
+        self.assertEqual(gpu_state.blend, 'NONE')
+
+    def test_refresh_scale_reads_preference(self):
+        prefs = types.SimpleNamespace(preferences=types.SimpleNamespace(pet_scale=2.5))
+        context = sys.modules['bpy'].context
+        with mock.patch.dict(context.preferences.addons, {renderer.__package__: prefs}):
+            renderer.refresh_scale(context)
+        self.assertEqual(renderer._size, [80, 80])
+
+    def test_failed_draw_restores_state(self):
+        renderer.draw_callback()
+        built_batches[0].fail = True
+
+        with self.assertRaises(RuntimeError):
+            renderer.draw_callback()
+        self.assertEqual(gpu_state.depth, 0)
+        self.assertEqual(gpu_state.blend, 'NONE')
+
+    def test_clear_batches(self):
+        renderer.draw_callback()
+        renderer.clear_batches()
+        self.assertEqual(renderer._batches, [None] * len(renderer._batches))
+
+    def test_unregister_resets_cache(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            renderer.register_draw_handler()
+            renderer.draw_callback()
+            self.assertIsNotNone(renderer.cached_shader)
+
+            renderer.unregister_draw_handler()
+        self.assertEqual(renderer._batches, [None] * len(renderer._batches))
+        self.assertIsNone(renderer.cached_shader)
+
+        renderer.draw_callback()
+        self.assertEqual(len(built_shaders), 2)
+        self.assertIs(built_batches[-1].shader, built_shaders[-1])
+
+
+class TestSteadyStateDraw(RendererTestCase):
+    """Long simulated runs must not allocate per draw.
+
+    Same approach as the engine's TestSteadyStateAllocations: runtime
+    tracemalloc and gc checks, plus a bytecode check for short-lived
+    containers that CPython's freelists hide from both.
+    """
+    DRAWS = 20000
+    DT = 0.1
+
+    def setUp(self):
+        super().setUp()
+        # Build every sprite cell's batch and the shader up front
+        renderer.draw_callback()
+        for row in range(renderer.SPRITE_ROWS):
+            for frame_index in range(renderer.SPRITE_COLUMNS):
+                for facing_right in (True, False):
+                    renderer.get_batch(renderer.cached_shader, row, frame_index, facing_right)
+        self.run_draws(self.DRAWS // 10)
+        prime_freelists()
+
+    def tick(self):
+        # Advance the pet between draws so x, row and frame keep changing
+        self.engine.last_tick -= self.DT
+        pet_engine.update(1000.0)
+
+    def run_draws(self, count):
+        for _ in range(count):
+            self.tick()
+            renderer.draw_callback()
+
+    def test_no_per_draw_allocations(self):
+        worst = 0
+        tracemalloc.start()
+        try:
+            for _ in range(self.DRAWS):
+                self.tick()
+                before = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+                renderer.draw_callback()
+                peak = tracemalloc.get_traced_memory()[1] - before
+                if peak > worst:
+                    worst = peak
+        finally:
+            tracemalloc.stop()
+
+        self.assertEqual(worst, 0)
+
+    def test_draw_builds_no_containers(self):
+        self.assertEqual(allocating_ops(renderer.draw_callback), [])
+
+    def gc_growth(self, count, collections):
+        def on_gc(phase, info):
+            if phase == 'start':
+                collections.append(info['generation'])
+
+        gc.collect()
+        before = gc.get_count()[0]
+        gc.callbacks.append(on_gc)
+        try:
+            self.run_draws(count)
+        finally:
+            gc.callbacks.remove(on_gc)
+        return gc.get_count()[0] - before
+
+    def test_no_gc_pressure(self):
+        collections = []
+        # Reading gc.get_count() itself tracks one tuple; subtract that exactly
+        overhead = self.gc_growth(0, collections)
+        growth = self.gc_growth(self.DRAWS, collections)
+
+        self.assertEqual(collections, [])
+        self.assertEqual(growth - overhead, 0)
+
+if __name__ == '__main__':
+    unittest.main()